@@ -390,9 +390,12 @@ def prune_unstructured(array: numpy.ndarray, sparsity: float) -> numpy.ndarray:
     if sparse_index < 0:
         return array
 
-    sorted_array = numpy.sort(numpy.abs(array.flatten()))
-    sparse_thresh = sorted_array[sparse_index]
-    array[numpy.abs(array) < sparse_thresh] = 0
+    # only the value at sparse_index is needed, so partially sort with
+    # numpy.partition instead of a full sort and reuse the abs array for
+    # both threshold selection and masking
+    abs_array = numpy.abs(array)
+    sparse_thresh = numpy.partition(abs_array, sparse_index, axis=None)[sparse_index]
+    array[abs_array < sparse_thresh] = 0
 
     return array
 
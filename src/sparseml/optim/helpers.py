@@ -25,6 +25,16 @@ from typing import Any, Dict, Optional, Tuple, Union
 
 import yaml
 
+
+try:
+    # libyaml-backed loader/dumper, an order of magnitude faster than the
+    # pure-Python implementations; fall back when PyYAML was built without it
+    from yaml import CSafeDumper as RecipeYamlDumper
+    from yaml import CSafeLoader as RecipeYamlLoader
+except ImportError:
+    from yaml import SafeDumper as RecipeYamlDumper
+    from yaml import SafeLoader as RecipeYamlLoader
+
 from sparseml import version as sparseml_version
 from sparseml.utils import (
     FRAMEWORK_METADATA_KEY,
@@ -37,6 +47,8 @@ from sparsezoo.objects import Recipe
 
 
 __all__ = [
+    "RecipeYamlDumper",
+    "RecipeYamlLoader",
     "load_recipe_yaml_str",
     "load_recipe_yaml_str_no_classes",
     "rewrite_recipe_yaml_string_with_classes",
@@ -134,7 +146,7 @@ def load_recipe_yaml_str_no_classes(recipe_yaml_str: str) -> str:
     """
     pattern = re.compile(r"!(?P<class_name>(?!.*\.)[a-zA-Z_][a-zA-Z^._0-9]+)")
     classless_yaml_str = pattern.sub(r"OBJECT.\g<class_name>:", recipe_yaml_str)
-    return yaml.safe_load(classless_yaml_str)
+    return yaml.load(classless_yaml_str, Loader=RecipeYamlLoader)
 
 
 def rewrite_recipe_yaml_string_with_classes(recipe_contianer: Any) -> str:
@@ -142,7 +154,7 @@ def rewrite_recipe_yaml_string_with_classes(recipe_contianer: Any) -> str:
     :param recipe_contianer: recipe loaded as yaml with load_recipe_yaml_str_no_classes
     :return: recipe serialized into YAML with original class values re-added
     """
-    updated_yaml_str = yaml.dump(recipe_contianer)
+    updated_yaml_str = yaml.dump(recipe_contianer, Dumper=RecipeYamlDumper)
 
     # convert object dicts back to object declarations and return
     pattern = re.compile(
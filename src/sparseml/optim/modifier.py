@@ -20,12 +20,14 @@ Modifiers allow modifying the training process of a model; ex to perform model p
 import hashlib
 import re
 from abc import ABC, abstractmethod
+from copy import deepcopy
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Union
 
 import yaml
 from yaml import ScalarNode
 
-from sparseml.optim.helpers import evaluate_recipe_yaml_str_equations
+from sparseml.optim.helpers import RecipeYamlLoader, evaluate_recipe_yaml_str_equations
 from sparseml.sparsification.types import SparsificationTypes
 
 
@@ -290,7 +292,13 @@ class BaseModifier(BaseObject):
         :return: the loaded modifiers list or dictionary of stage name to stage
             modifiers list if given a yaml string of a staged recipe
         """
+        # parses of identical recipe strings are memoized; deepcopy so callers
+        # mutating the returned modifiers do not poison the cache
+        return deepcopy(BaseModifier._load_framework_list_cached(yaml_str, framework))
 
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _load_framework_list_cached(yaml_str: str, framework: str):
         def _load_stage_modifiers(stage_container):
             stage_modifiers = []  # type: List[BaseModifier]
             for name, item in stage_container.items():
@@ -315,7 +323,7 @@ class BaseModifier(BaseObject):
         # evaluate recipe equations and load into yaml container object
         yaml_str = evaluate_recipe_yaml_str_equations(yaml_str)
         yaml_str = BaseModifier._convert_to_framework_modifiers(yaml_str, framework)
-        container = yaml.safe_load(yaml_str)
+        container = yaml.load(yaml_str, Loader=RecipeYamlLoader)
 
         if isinstance(container, BaseModifier):
             modifiers = [container]
@@ -351,11 +359,25 @@ class BaseModifier(BaseObject):
         :param framework: the framework to load the modifier for
         :return: the loaded modifier object
         """
+        return deepcopy(BaseModifier._load_framework_obj_cached(yaml_str, framework))
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _load_framework_obj_cached(yaml_str: str, framework: str):
         yaml_str = BaseModifier._convert_to_framework_modifiers(yaml_str, framework)
-        modifier = yaml.safe_load(yaml_str)
+        modifier = yaml.load(yaml_str, Loader=RecipeYamlLoader)
 
         return modifier
 
+    @staticmethod
+    def clear_load_cache():
+        """
+        Clear the memoized recipe parses kept by load_framework_list and
+        load_framework_obj; mainly useful for test isolation
+        """
+        BaseModifier._load_framework_list_cached.cache_clear()
+        BaseModifier._load_framework_obj_cached.cache_clear()
+
     @staticmethod
     def yaml_key(clazz, framework: Union[str, None] = None):
         """
@@ -836,5 +858,10 @@ class ModifierYAML(object):
             constructor,
             yaml.SafeLoader,
         )
+        yaml.add_constructor(
+            yaml_key,
+            constructor,
+            RecipeYamlLoader,
+        )
 
         return clazz
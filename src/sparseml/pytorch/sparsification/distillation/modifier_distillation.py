@@ -28,6 +28,12 @@ from torch import Tensor
 from torch.nn import Module
 from torch.optim import Optimizer
 
+
+try:
+    from torch.cuda.amp import autocast
+except ImportError:
+    autocast = None
+
 from sparseml.optim import BaseModifier, ModifierProp
 from sparseml.pytorch.sparsification.modifier import (
     PyTorchModifierYAML,
@@ -46,6 +52,35 @@ __all__ = [
 _LOGGER = logging.getLogger(__name__)
 
 
+def _kldiv_head_loss(
+    student_val: Tensor,
+    teacher_val: Tensor,
+    temperature: float,
+    temperature_squared: float,
+) -> Tensor:
+    return (
+        TF.kl_div(
+            input=TF.log_softmax(student_val / temperature, dim=-1),
+            # the teacher's soft targets are constants w.r.t. the student,
+            # detach so no autograd graph is built on the teacher side
+            target=TF.log_softmax(teacher_val.detach() / temperature, dim=-1),
+            log_target=True,
+            reduction="sum",
+        )
+        * temperature_squared
+        / (student_val.numel() / student_val.shape[-1])
+    )
+
+
+try:
+    # script the per-head loss so its chain of pointwise/reduction calls runs
+    # through a single TorchScript dispatch per step instead of op by op
+    # through the Python layer; fall back to eager if scripting is unavailable
+    _kldiv_head_loss = torch.jit.script(_kldiv_head_loss)
+except Exception:  # pragma: no cover
+    pass
+
+
 @PyTorchModifierYAML()
 class DistillationModifier(ScheduledUpdateModifier):
     """
@@ -94,6 +129,7 @@ class DistillationModifier(ScheduledUpdateModifier):
         )
         self._hardness = hardness
         self._temperature = temperature
+        self._temperature_squared = temperature * temperature
         self._distill_output_keys = distill_output_keys
         self._teacher_input_keys = teacher_input_keys
 
@@ -140,6 +176,7 @@ class DistillationModifier(ScheduledUpdateModifier):
             distillation
         """
         self._temperature = value
+        self._temperature_squared = value * value
 
     @ModifierProp()
     def distill_output_keys(self) -> Optional[List[Any]]:
@@ -273,6 +310,11 @@ class DistillationModifier(ScheduledUpdateModifier):
         if not self.update_ready(epoch, steps_per_epoch):
             return loss
 
+        if self._hardness == 0.0:
+            # a hardness of 0 weights the distillation term out of the total
+            # loss, skip the teacher forward pass and KL computation entirely
+            return loss
+
         if student_outputs is None or student_inputs is None:
             raise ValueError(
                 "Student outputs and student inputs are required for "
@@ -316,7 +358,14 @@ class DistillationModifier(ScheduledUpdateModifier):
                 f"teacher output type of {type(teacher_outputs)}"
             )
 
-        teacher_loss = self._kldiv_output_loss(student_outputs, teacher_outputs)
+        # run the distillation loss under AMP autocast on CUDA devices to halve
+        # the bandwidth of the logit-sized intermediates; the final KL reduction
+        # is cast back to FP32 for stability
+        if autocast is not None and inputs_device.type == "cuda":
+            with autocast():
+                teacher_loss = self._kldiv_output_loss(student_outputs, teacher_outputs)
+        else:
+            teacher_loss = self._kldiv_output_loss(student_outputs, teacher_outputs)
         total_loss = ((1.0 - self._hardness) * loss) + (self._hardness * teacher_loss)
         self._logged_loss_terms.update(
             {"teacher_loss": teacher_loss, "total_loss": total_loss}
@@ -366,42 +415,51 @@ class DistillationModifier(ScheduledUpdateModifier):
         self._teacher = None
         self._distillation_enabled = False
 
-    def _calc_distill_head_output_loss(
-        self, student_val: Tensor, teacher_val: Tensor
-    ) -> Tensor:
-        v = (
-            TF.kl_div(
-                input=TF.log_softmax(student_val / self._temperature, dim=-1),
-                target=TF.log_softmax(teacher_val / self._temperature, dim=-1),
-                log_target=True,
-                reduction="sum",
-            )
-            * (self._temperature ** 2)
-            / (student_val.numel() / student_val.shape[-1])
-        )
-        return v
-
     def _kldiv_output_loss(self, student_outputs, teacher_outputs):
+        # hoist the hot scalar fields into locals once per step, the
+        # temperature ModifierProp remains for YAML (de)serialization only
+        temperature = self._temperature
+        temperature_squared = self._temperature_squared
+        output_keys = self._distill_output_keys
+
         # Distillation loss from the head outputs
         distill_head_output_losses = []
         if isinstance(student_outputs, Tensor):
             distill_head_output_losses.append(
-                self._calc_distill_head_output_loss(student_outputs, teacher_outputs)
+                _kldiv_head_loss(
+                    student_outputs, teacher_outputs, temperature, temperature_squared
+                ).float()
             )
         elif isinstance(student_outputs, Mapping):
-            for key in self._distill_output_keys or student_outputs:
+            for key in output_keys or student_outputs:
                 distill_head_output_losses.append(
-                    self._calc_distill_head_output_loss(
-                        student_outputs[key], teacher_outputs[key]
-                    )
+                    _kldiv_head_loss(
+                        student_outputs[key],
+                        teacher_outputs[key],
+                        temperature,
+                        temperature_squared,
+                    ).float()
                 )
         elif isinstance(student_outputs, Iterable):
-            for idx in self._distill_output_keys or range(len(student_outputs)):
-                distill_head_output_losses.append(
-                    self._calc_distill_head_output_loss(
-                        student_outputs[idx], teacher_outputs[idx]
+            if output_keys:
+                for idx in output_keys:
+                    distill_head_output_losses.append(
+                        _kldiv_head_loss(
+                            student_outputs[idx],
+                            teacher_outputs[idx],
+                            temperature,
+                            temperature_squared,
+                        ).float()
+                    )
+            else:
+                # zip the outputs directly instead of indexing into both
+                # containers to avoid a __getitem__ dispatch per output pair
+                for student_val, teacher_val in zip(student_outputs, teacher_outputs):
+                    distill_head_output_losses.append(
+                        _kldiv_head_loss(
+                            student_val, teacher_val, temperature, temperature_squared
+                        ).float()
                     )
-                )
         kldiv_output_loss = (
             sum(distill_head_output_losses) / len(distill_head_output_losses)
             if distill_head_output_losses
@@ -19,7 +19,8 @@ For example, learning rate schedules or kernel sparsity (weight pruning)
 are implemented as modifiers.
 """
 
-import math
+import sys
+from functools import wraps
 from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 from torch import Tensor
@@ -40,6 +41,7 @@ from sparseml.utils import PYTORCH_FRAMEWORK
 
 __all__ = [
     "ModifierProp",
+    "INF_EPOCH",
     "PYTORCH_FRAMEWORK",
     "PyTorchModifierYAML",
     "Modifier",
@@ -48,6 +50,21 @@ __all__ = [
 ]
 
 
+INF_EPOCH = float("inf")
+
+
+_EMPTY_LOGGER_MANAGER = None
+
+
+def _empty_logger_manager() -> LoggerManager:
+    # shared fallback manager for modifiers initialized without loggers,
+    # created lazily so import stays cheap; callers must not mutate it
+    global _EMPTY_LOGGER_MANAGER
+    if _EMPTY_LOGGER_MANAGER is None:
+        _EMPTY_LOGGER_MANAGER = LoggerManager([])
+    return _EMPTY_LOGGER_MANAGER
+
+
 class PyTorchModifierYAML(ModifierYAML):
     """
     A decorator to handle making a pytorch modifier class YAML ready.
@@ -102,15 +119,37 @@ class Modifier(BaseModifier):
         super().__init__(**kwargs)
         self._loggers_initialized = False
         self._loggers = None
+        self._loggers_source = None
+        self._sparsification_types_set = None
 
     def __del__(self):
         try:
-            if not self.initialized:
-                return
-            self.finalize()
+            # read the private flag directly: __del__ may run on a partially
+            # constructed instance if __init__ raised, and the ModifierProp
+            # descriptor lookup is wasted work on the common no-op path
+            if getattr(self, "_initialized", False):
+                self.finalize()
         except Exception:
             pass
 
+    def _check_lifecycle_state(self, loggers: bool = False, enabled: bool = True):
+        """
+        Single point for the lifecycle guards repeated by the per-step methods
+        so each call site performs one check instead of two or three
+
+        :param loggers: True to also require loggers to be initialized
+        :param enabled: True to also require the modifier to be enabled
+        :raises RuntimeError: if any required lifecycle state is not met
+        """
+        if not self._initialized:
+            raise RuntimeError("modifier must be initialized first")
+
+        if loggers and not self._loggers_initialized:
+            raise RuntimeError("modifier must have loggers initialized first")
+
+        if enabled and not self._enabled:
+            raise RuntimeError("modifier must be enabled")
+
     @ModifierProp(serializable=False)
     def loggers_initialized(self):
         """
@@ -151,7 +190,7 @@ class Modifier(BaseModifier):
     def apply(
         self,
         module: Module,
-        epoch: float = math.inf,
+        epoch: float = INF_EPOCH,
         loggers: Optional[LoggerManager] = None,
         finalize: bool = True,
         **kwargs,
@@ -162,7 +201,7 @@ class Modifier(BaseModifier):
         finalize(module, **kwargs) immediately after if finalize=True.
 
         :param module: the PyTorch model/module to modify
-        :param epoch: the epoch to apply the modifier at, defaults to math.inf (end)
+        :param epoch: the epoch to apply the modifier at, defaults to INF_EPOCH (end)
         :param loggers: Optional logger manager to log the modification process to
         :param finalize: True to invoke finalize after initialize, False otherwise.
             If training after one shot, set finalize=False to keep modifiers applied.
@@ -192,11 +231,19 @@ class Modifier(BaseModifier):
         :param epoch: the epoch to apply the modifier at, defaults to 0.0 (start)
         :param loggers: Optional logger manager to log the modification process to
         :param finalize: True to invoke finalize after initialize, False otherwise.
-            Set finalize to True and epoch to math.inf for one shot application.
+            Set finalize to True and epoch to INF_EPOCH for one shot application.
         :param kwargs: Optional kwargs to support specific arguments
             for individual modifiers (passed to initialize and finalize).
         """
-        if SparsificationTypes.structured not in self.sparsification_types:
+        types = self._sparsification_types_set
+        if types is None:
+            # the sparsification_types prop builds a new list on each access;
+            # cache it as a frozenset for the membership test
+            types = self._sparsification_types_set = frozenset(
+                self.sparsification_types
+            )
+
+        if SparsificationTypes.structured not in types:
             return
 
         self.initialize(module, epoch, loggers, **kwargs)
@@ -234,11 +281,22 @@ class Modifier(BaseModifier):
         :param loggers: the logger maanger to setup this modifier with for logging
         important info and milestones to
         """
-        loggers = loggers or []
-        if isinstance(loggers, List):
-            loggers = LoggerManager(loggers)
+        if loggers is not None and loggers is self._loggers_source:
+            # same source object as the currently assigned manager,
+            # nothing to rebuild
+            self._loggers_initialized = True
+            return
+
+        source = loggers
+        if not loggers:
+            # overwhelmingly common case (one shot application); reuse a
+            # single shared empty manager instead of allocating one per call
+            loggers = _empty_logger_manager()
+        elif isinstance(loggers, (list, tuple)):
+            loggers = LoggerManager(list(loggers))
         self._loggers_initialized = True
         self._loggers = loggers
+        self._loggers_source = source
 
     def finalize(
         self, module: Optional[Module] = None, reset_loggers: bool = True, **kwargs
@@ -262,6 +320,7 @@ class Modifier(BaseModifier):
 
         if reset_loggers:
             self._loggers = None
+            self._loggers_source = None
             self._loggers_initialized = False
 
     def update(
@@ -277,11 +336,7 @@ class Modifier(BaseModifier):
         :param steps_per_epoch: number of steps taken within each epoch
             (calculate batch number using this and epoch)
         """
-        if not self._initialized:
-            raise RuntimeError("modifier must be initialized first")
-
-        if not self._enabled:
-            raise RuntimeError("modifier must be enabled")
+        self._check_lifecycle_state()
 
     def log_update(
         self,
@@ -300,14 +355,7 @@ class Modifier(BaseModifier):
         :param steps_per_epoch: number of steps taken within each epoch
             (calculate batch number using this and epoch)
         """
-        if not self._initialized:
-            raise RuntimeError("modifier must be initialized first")
-
-        if not self._loggers_initialized:
-            raise RuntimeError("modifier must have loggers initialized first")
-
-        if not self._enabled:
-            raise RuntimeError("modifier must be enabled")
+        self._check_lifecycle_state(loggers=True)
 
     def loss_update(
         self,
@@ -322,6 +370,7 @@ class Modifier(BaseModifier):
         Optional call that can be made on the optimizer to update the modifiers
         once the loss has been calculated.
         Called independent of if the modifier is currently active or not.
+        Disabled modifiers pass the loss through unchanged.
 
         :param loss: The calculated loss tensor
         :param module: module to modify
@@ -331,11 +380,12 @@ class Modifier(BaseModifier):
             (calculate batch number using this and epoch)
         :return: the modified loss tensor
         """
-        if not self._initialized:
-            raise RuntimeError("modifier must be initialized first")
-
         if not self._enabled:
-            raise RuntimeError("modifier must be enabled")
+            # act as an identity on the loss so training loops can chain
+            # loss_update across all modifiers without guarding on enabled
+            return loss
+
+        self._check_lifecycle_state(enabled=False)
 
         return loss
 
@@ -353,11 +403,7 @@ class Modifier(BaseModifier):
         :param steps_per_epoch: number of steps taken within each epoch
             (calculate batch number using this and epoch)
         """
-        if not self._initialized:
-            raise RuntimeError("modifier must be initialized first")
-
-        if not self._enabled:
-            raise RuntimeError("modifier must be enabled")
+        self._check_lifecycle_state()
 
     def optimizer_post_step(
         self, module: Module, optimizer: Optimizer, epoch: float, steps_per_epoch: int
@@ -372,11 +418,7 @@ class Modifier(BaseModifier):
         :param steps_per_epoch: number of steps taken within each epoch
             (calculate batch number using this and epoch)
         """
-        if not self._initialized:
-            raise RuntimeError("modifier must be initialized first")
-
-        if not self._enabled:
-            raise RuntimeError("modifier must be enabled")
+        self._check_lifecycle_state()
 
 
 class ScheduledModifier(Modifier, BaseScheduled):
@@ -414,6 +456,17 @@ class ScheduledModifier(Modifier, BaseScheduled):
     :param kwargs: standard key word args, used to support multi inheritance
     """
 
+    _log_tag = None
+
+    @classmethod
+    def _get_log_tag(cls) -> str:
+        # cache the interned class name per subclass; looked up from
+        # cls.__dict__ so subclasses never reuse an inherited cached tag
+        tag = cls.__dict__.get("_log_tag")
+        if tag is None:
+            tag = cls._log_tag = sys.intern(cls.__name__)
+        return tag
+
     @staticmethod
     def log_call(func):
         """
@@ -422,29 +475,37 @@ class ScheduledModifier(Modifier, BaseScheduled):
         used and when it is exited
         """
 
+        @wraps(func)
         def wrapper(*args, **kwargs):
             self = args[0]
             epoch = kwargs.get("epoch", None)
             steps_per_epoch = kwargs.get("steps_per_epoch", None)
+            # evaluate readiness once and reuse it for the call and return
+            # logs; all argument formatting stays behind this check so
+            # non-logging steps pay a single boolean test
+            loggers = self._loggers
+            log_ready = loggers is not None and loggers.log_ready(
+                epoch, self._last_log_epoch
+            )
             # Log call state
-            if self.loggers and self.loggers.log_ready(epoch, self._last_log_epoch):
+            if log_ready:
                 self.log_string(
                     string=(
                         f"Calling {func.__name__} with:\n"
                         f"args: {format_args(args[1:])}\n"
                         f"kwargs: {format_args(kwargs)}"
                     ),
-                    loggers=self.loggers,
+                    loggers=loggers,
                     epoch=epoch,
                     steps_per_epoch=steps_per_epoch,
                 )
             out = func(*args, **kwargs)
             # Log return state
-            if self.loggers and self.loggers.log_ready(epoch, self._last_log_epoch):
-                out_print = out if isinstance(out, Tuple) else [out]
+            if log_ready:
+                out_print = out if isinstance(out, tuple) else [out]
                 self.log_string(
                     string=(f"\nReturned: {format_args(out_print)}\n"),
-                    loggers=self.loggers,
+                    loggers=loggers,
                     epoch=epoch,
                     steps_per_epoch=steps_per_epoch,
                 )
@@ -456,25 +517,24 @@ class ScheduledModifier(Modifier, BaseScheduled):
             if they are of type (float, int, str, toch.Tensor), otherwise only their
             type is printed.
             """
-            args_string = ""
             printable = (float, int, str, Tensor)
             if not args:  # handles empty function returns
                 return None
             if not isinstance(args, Iterable):  # handles single function return
                 args = [args]
+            # build the parts in a list and join once; += on a str in a loop
+            # reallocates the full string on every append
             if isinstance(args, Dict):  # handles kwargs
-                for k, v in args.items():
-                    if isinstance(v, printable):
-                        args_string += f"{k}: {v}| "
-                    else:
-                        args_string += f"{k}: {type(v)}| "
+                parts = [
+                    f"{k}: {v}| " if isinstance(v, printable) else f"{k}: {type(v)}| "
+                    for k, v in args.items()
+                ]
             else:  # handles lists (args, single return) and tuples (returns)
-                for arg in args:
-                    if isinstance(arg, printable):
-                        args_string += f"{arg}| "
-                    else:
-                        args_string += f"{type(arg)}| "
-            return args_string
+                parts = [
+                    f"{arg}| " if isinstance(arg, printable) else f"{type(arg)}| "
+                    for arg in args
+                ]
+            return "".join(parts)
 
         return wrapper
 
@@ -504,6 +564,26 @@ class ScheduledModifier(Modifier, BaseScheduled):
 
         self.validate_schedule()
 
+    def validate_schedule(self):
+        """
+        Validate the schedule values of the params for the current instance are valid.
+        Additionally refreshes the cached epoch thresholds the pending checks
+        compare against
+        """
+        super().validate_schedule()
+
+        # fold the -1.0 (immediate/never) sentinel handling into single
+        # comparable thresholds so start_pending and end_pending reduce to one
+        # float compare on the per-step path
+        if self._start_epoch >= 0.0:
+            self._start_threshold = self._start_epoch
+        elif self._start_epoch == -1.0:
+            self._start_threshold = -INF_EPOCH
+        else:
+            self._start_threshold = INF_EPOCH
+
+        self._end_threshold = self._end_epoch if self._end_epoch >= 0.0 else INF_EPOCH
+
     @ModifierProp(serializable=False)
     def started(self) -> bool:
         """
@@ -529,16 +609,13 @@ class ScheduledModifier(Modifier, BaseScheduled):
             (calculate batch number using this and epoch)
         :return: True if the modifier is ready to begin modifying, false otherwise
         """
-        if not self._initialized:
-            raise RuntimeError("modifier must be initialized first")
+        self._check_lifecycle_state(enabled=False)
 
         if not self._enabled:
             return False
 
         pending = (
-            not self._started
-            and not self._ended
-            and (epoch >= self._start_epoch >= 0.0 or self._start_epoch == -1.0)
+            not self._started and not self._ended and epoch >= self._start_threshold
         )
 
         return pending
@@ -553,13 +630,12 @@ class ScheduledModifier(Modifier, BaseScheduled):
             (calculate batch number using this and epoch)
         :return: True if the modifier is ready to stop modifying, false otherwise
         """
-        if not self._initialized:
-            raise RuntimeError("modifier must be initialized first")
+        self._check_lifecycle_state(enabled=False)
 
         if not self._enabled:
             return False
 
-        pending = not self._ended and self._started and epoch >= self._end_epoch >= 0.0
+        pending = not self._ended and self._started and epoch >= self._end_threshold
 
         return pending
 
@@ -572,8 +648,7 @@ class ScheduledModifier(Modifier, BaseScheduled):
             (calculate batch number using this and epoch)
         :return: True if the modifier is pending an update and update() should be called
         """
-        if not self._initialized:
-            raise RuntimeError("modifier must be initialized first")
+        self._check_lifecycle_state(enabled=False)
 
         if not self._enabled:
             return False
@@ -600,7 +675,15 @@ class ScheduledModifier(Modifier, BaseScheduled):
         if not self._initialized:
             raise RuntimeError("modifier must be initialized first")
 
-        if not self.update_ready(epoch, steps_per_epoch):
+        # evaluate the pending predicates once and reuse them after update();
+        # update_ready is only consulted when neither is pending so subclasses
+        # firing on other conditions (update frequency) still pass the guard
+        start_pending = self.start_pending(epoch, steps_per_epoch)
+        end_pending = self.end_pending(epoch, steps_per_epoch)
+
+        if not (start_pending or end_pending) and not self.update_ready(
+            epoch, steps_per_epoch
+        ):
             raise RuntimeError(
                 "update_ready returns False, this must be true to call scheduled_update"
             )
@@ -609,10 +692,10 @@ class ScheduledModifier(Modifier, BaseScheduled):
         self.update(module, optimizer, epoch=epoch, steps_per_epoch=steps_per_epoch)
         self._schedule_called = False
 
-        if self.start_pending(epoch, steps_per_epoch):
+        if start_pending:
             self._started = True
 
-        if self.end_pending(epoch, steps_per_epoch):
+        if end_pending:
             self._ended = True
 
     def update(
@@ -651,16 +734,12 @@ class ScheduledModifier(Modifier, BaseScheduled):
             (calculate batch number using this and epoch)
         """
 
-        if not self._initialized:
-            raise RuntimeError("modifier must be initialized first")
-
-        if not self._loggers_initialized:
-            raise RuntimeError("modifier must have loggers initialized first")
-
-        if not self._enabled:
-            raise RuntimeError("modifier must be enabled")
+        self._check_lifecycle_state(loggers=True)
 
-        if self.loggers and self.loggers.log_ready(epoch, self._last_log_epoch):
+        # read the manager once; the loggers property goes through the
+        # ModifierProp descriptor on each access
+        loggers = self._loggers
+        if loggers and loggers.log_ready(epoch, self._last_log_epoch):
             self._last_log_epoch = epoch
             self._scheduled_log_called = True
             self.log_update(module, optimizer, epoch, steps_per_epoch)
@@ -701,7 +780,7 @@ class ScheduledModifier(Modifier, BaseScheduled):
         steps_per_epoch: Optional[int] = None,
         level: Optional[int] = None,
     ):
-        tag = tag or type(self).__name__
+        tag = tag or type(self)._get_log_tag()
         loggers = loggers or self.loggers
         level = level or LOGGING_LEVELS["debug"]
         step = (
@@ -720,7 +799,7 @@ class ScheduledModifier(Modifier, BaseScheduled):
         steps_per_epoch: Optional[int] = None,
         level: Optional[int] = None,
     ):
-        tag = tag or type(self).__name__
+        tag = tag or type(self)._get_log_tag()
         loggers = loggers or self.loggers
         step = (
             loggers.epoch_to_step(epoch, steps_per_epoch)
@@ -737,14 +816,18 @@ class ScheduledModifier(Modifier, BaseScheduled):
         steps_per_epoch: Optional[int] = None,
         level: Optional[int] = None,
     ):
+        # resolve the manager, step, and tag prefix once for the whole batch
+        # instead of once per name-value pair through log_scalar
+        loggers = loggers or self.loggers
+        step = (
+            loggers.epoch_to_step(epoch, steps_per_epoch)
+            if (epoch is not None) and (steps_per_epoch is not None)
+            else None
+        )
+        tag_prefix = type(self)._get_log_tag()
         for name, value in name_value_pairs:
-            self.log_scalar(
-                value=value,
-                tag=f"{type(self).__name__}/{name}",
-                loggers=loggers,
-                epoch=epoch,
-                steps_per_epoch=steps_per_epoch,
-                level=level,
+            loggers.log_scalar(
+                tag=f"{tag_prefix}/{name}", value=value, step=step, level=level
             )
 
 
@@ -806,6 +889,34 @@ class ScheduledUpdateModifier(ScheduledModifier, BaseUpdate):
         )
         self._last_update_epoch = -1.0
 
+    @property
+    def _last_update_epoch(self) -> float:
+        return self.__last_update_epoch
+
+    @_last_update_epoch.setter
+    def _last_update_epoch(self, value: float):
+        # refresh the precomputed next firing epoch on every write, including
+        # direct assignments from subclasses and test helpers, so update_ready
+        # stays a single compare without desyncing from the cache
+        self.__last_update_epoch = value
+        self._next_update_epoch = (
+            value + self._update_frequency if value >= 0.0 else INF_EPOCH
+        )
+
+    def validate_update(self):
+        """
+        Validate the update schedule values of the params for the current instance
+        are valid
+        """
+        super().validate_update()
+
+        # resync the precomputed next firing epoch when update_frequency
+        # changes after the last update epoch was recorded
+        last = getattr(self, "_last_update_epoch", -1.0)
+        self._next_update_epoch = (
+            last + self._update_frequency if last >= 0.0 else INF_EPOCH
+        )
+
     def update_ready(self, epoch: float, steps_per_epoch: int) -> bool:
         """
         Calls base implementation to check if start_pending() or end_pending().
@@ -825,13 +936,7 @@ class ScheduledUpdateModifier(ScheduledModifier, BaseUpdate):
             self.started
             and epoch > self._start_epoch
             and not self.ended
-            and (
-                (self._update_frequency == -1.0)
-                or (
-                    self._last_update_epoch >= 0.0
-                    and epoch >= self._last_update_epoch + self._update_frequency
-                )
-            )
+            and ((self._update_frequency == -1.0) or epoch >= self._next_update_epoch)
         )
 
         return start_or_end or update_ready